@@ -1,114 +1,458 @@
 import argparse
 import csv
+import hashlib
+import heapq
 import json
+import os
+import re
 import sys
+import tempfile
+import time
 import requests
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from operator import itemgetter
+from urllib.parse import quote
 from colorama import Fore, Style, init
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-init(autoreset=True)
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-def get_victims_by_group(group_name):
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Colors are only produced for a terminal; when the output is redirected, the escape
+# sequences would be stripped again, so neither they nor colorama's wrapper are used.
+_USE_COLOR = sys.stdout.isatty()
+if _USE_COLOR:
+    init(autoreset=True)
+    _CYAN, _GREEN, _MAGENTA, _BLUE, _YELLOW, _RESET = Fore.CYAN, Fore.GREEN, Fore.MAGENTA, Fore.BLUE, Fore.YELLOW, Style.RESET_ALL
+else:
+    _CYAN = _GREEN = _MAGENTA = _BLUE = _YELLOW = _RESET = ""
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ransomware-stats")
+DEFAULT_CACHE_TTL = 3600
+_CHUNK_SIZE = 64 * 1024
+_MONTH_RE = re.compile(r"([0-9]{4}-(?:0[1-9]|1[0-2]))[-T ]")
+# Placeholder for a missing country or sector; every such key refers to this one object.
+_NOT_IDENTIFIED = sys.intern("Not Identified")
+
+# In-process memo of aggregations by payload digest, keeping the most recently used ones.
+_AGGREGATE_MEMO = OrderedDict()
+_AGGREGATE_MEMO_SIZE = 8
+# Bumped whenever the layout of the stored aggregation changes.
+_AGGREGATE_FORMAT = 3
+
+# Shared session so repeated queries reuse the pooled HTTPS connections (no new TLS
+# handshake per call); transient server errors are retried on the same pool.
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept": "application/json"})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+))
+
+def _cache_paths(group_name):
+    """
+    Returns the paths of the cached API response, of its metadata sidecar and of the
+    stored aggregation for a group.
+    """
+    base = os.path.join(CACHE_DIR, quote(group_name, safe=""))
+    return base + ".json", base + ".meta", base + ".agg.json"
+
+def _read_cache_meta(meta_path):
+    """
+    Reads the metadata sidecar (fetch time, validators, digest) of a cached response.
+    Returns an empty dict if the sidecar is missing or unreadable.
+    """
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _open_temp(path):
+    """
+    Creates a uniquely named temporary file next to path, so concurrent runs never write
+    to the same file. Returns (file object, temporary path).
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    return os.fdopen(fd, "wb"), tmp_path
+
+def _replace_from_temp(tmp_path, path):
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        os.remove(tmp_path)
+        raise
+
+def _write_atomic(path, data):
+    """
+    Writes bytes to path through a temporary file, so readers never see a partial file.
+    """
+    f, tmp_path = _open_temp(path)
+    try:
+        with f:
+            f.write(data)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    _replace_from_temp(tmp_path, path)
+
+def _stream_to_cache(response, data_path):
+    """
+    Streams a response body into data_path through a temporary file, hashing it on the
+    way, so the payload is never held in memory as a whole. Returns the BLAKE2b hex digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    f, tmp_path = _open_temp(data_path)
+    try:
+        with f:
+            for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                digest.update(chunk)
+                f.write(chunk)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    _replace_from_temp(tmp_path, data_path)
+    return digest.hexdigest()
+
+def _file_identity(path):
+    """
+    Returns [inode, size] of a file, or None if it does not exist. Every cache write
+    creates a new file, so this identifies the exact payload a metadata sidecar describes.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_ino, st.st_size]
+
+def _iter_cached_victims(data_path):
+    """
+    Yields the victims stored in a cached response. With ijson installed the file is
+    parsed incrementally, so only one victim is materialized at a time; otherwise the
+    whole list is loaded with json.
     """
-    Queries the ransomware.live API to return the victims associated with a group.
+    with open(data_path, "rb") as f:
+        if ijson is None:
+            yield from json.load(f)
+        else:
+            yield from ijson.items(f, "item")
+
+def _discard_cached_response(group_name):
+    """
+    Removes the cached response of a group and its sidecars, so the next run queries the API again.
+    """
+    for path in _cache_paths(group_name):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def get_group_response(group_name, cache_ttl=DEFAULT_CACHE_TTL):
+    """
+    Queries the ransomware.live API for the victims associated with a group and returns
+    (path, digest) of the cached JSON response, or None if the query failed.
     The URI used was: /groupvictims/<group_name>
+    The response is cached on disk for cache_ttl seconds. Once expired, the cached
+    copy is revalidated with If-None-Match/If-Modified-Since and reused on HTTP 304.
     """
+    data_path, meta_path, _ = _cache_paths(group_name)
+    meta = _read_cache_meta(meta_path)
+    # The sidecar is only trusted if it was written for the payload currently on disk; an
+    # interrupted or concurrent write can leave it describing another one.
+    has_cache = bool(meta.get("digest")) and meta.get("file") == _file_identity(data_path)
+    if has_cache and time.time() - os.path.getmtime(data_path) < cache_ttl:
+        return data_path, meta["digest"]
+
+    headers = {}
+    if has_cache:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
     base_url = "https://api.ransomware.live/v2/groupvictims/"
     url = base_url + group_name
     try:
-        response = requests.get(url, headers={"Accept": "application/json"})
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(f"Error: {response.status_code}")
-            return []
+        with _SESSION.get(url, headers=headers, timeout=(3.05, 30), stream=True) as response:
+            if response.status_code == 304 and has_cache:
+                os.utime(data_path)
+                return data_path, meta["digest"]
+            if response.status_code == 200:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                # Drop the old sidecar first, so a crash before the new one is written
+                # leaves no digest pointing at the new payload.
+                if os.path.exists(meta_path):
+                    os.remove(meta_path)
+                digest = _stream_to_cache(response, data_path)
+                _write_atomic(meta_path, json.dumps({
+                    "fetched_at": time.time(),
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "digest": digest,
+                    "file": _file_identity(data_path)
+                }).encode("utf-8"))
+                return data_path, digest
+            else:
+                print(f"Error: {response.status_code}")
+                return None
     except Exception as e:
         print(f"An error occurred: {e}")
+        return None
+
+def get_victims_by_group(group_name, cache_ttl=DEFAULT_CACHE_TTL):
+    """
+    Returns the list of victims associated with a group (see get_group_response).
+    """
+    response = get_group_response(group_name, cache_ttl)
+    if response is None:
         return []
+    try:
+        return list(_iter_cached_victims(response[0]))
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        _discard_cached_response(group_name)
+        return []
+
+class MonthAgg:
+    """
+    Aggregated victims of one month: the total, the frequency of sectors and countries,
+    the sectors affected in each country and the cached rankings (see _month_rankings).
+    """
+    __slots__ = ("total", "sectors", "countries", "country_sectors", "rankings")
+
+    def __init__(self):
+        self.total = 0
+        self.sectors = Counter()
+        self.countries = Counter()
+        self.country_sectors = defaultdict(Counter)
+        self.rankings = None
+
+    def to_json(self):
+        """
+        Returns the counters as plain JSON-serializable data (the rankings are not stored).
+        """
+        return {
+            "total": self.total,
+            "sectors": self.sectors,
+            "countries": self.countries,
+            "country_sectors": self.country_sectors
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        """
+        Rebuilds a MonthAgg from the data returned by to_json, keeping the counters' order.
+        """
+        agg = cls()
+        agg.total = int(data["total"])
+        agg.sectors = Counter(data["sectors"])
+        agg.countries = Counter(data["countries"])
+        agg.country_sectors = defaultdict(Counter, ((country, Counter(sectors)) for country, sectors in data["country_sectors"].items()))
+        return agg
+
+def _iter_victim_keys(victims):
+    """
+    Yields a (month, country, sector) key for each victim with a valid discovery date.
+    """
+    for victim in victims:
+        discovered = victim.get("discovered")
+        if not discovered:
+            continue
+        # "discovered" is normally an ISO-8601 string ("YYYY-MM-DD ..."), so the month
+        # is matched directly; anything else goes through the full parser.
+        match = _MONTH_RE.match(discovered)
+        if match is not None:
+            month_key = match.group(1)
+        else:
+            try:
+                dt = datetime.fromisoformat(discovered)
+                month_key = dt.strftime("%Y-%m")
+            except Exception:
+                continue
+        
+        yield month_key, victim.get("country") or _NOT_IDENTIFIED, victim.get("activity") or _NOT_IDENTIFIED
 
 def process_victims(victims):
     """
-    Processes the list of victims to group by month in the format: YYYY-MM.
+    Processes the victims (any iterable, consumed once) to group by month in the format: YYYY-MM.
     For each month, it will group:
       - Total victims.
       - Frequency of sectors (field 'activity').
       - Frequency of countries (field 'country').
       - For each country, groups the affected sectors.
     """
-    monthly_data = defaultdict(lambda: {
-        "total": 0,
-        "sectors": Counter(),
-        "countries": Counter(),
-        "country_sectors": defaultdict(Counter)
-    })
+    monthly_data = defaultdict(MonthAgg)
     
-    for victim in victims:
-        discovered = victim.get("discovered")
-        if not discovered:
-            continue
-        try:
-            dt = datetime.fromisoformat(discovered)
-            month_key = dt.strftime("%Y-%m")
-        except Exception:
-            continue
-        
-        monthly_data[month_key]["total"] += 1
-        sector = victim.get("activity") or "Not Identified"
-        country = victim.get("country") or "Not Identified"
-        
-        monthly_data[month_key]["sectors"][sector] += 1
-        monthly_data[month_key]["countries"][country] += 1
-        monthly_data[month_key]["country_sectors"][country][sector] += 1
+    # Count every (month, country, sector) combination with a single hashed insert
+    # per victim, then derive all the per-month aggregates in one pass over the
+    # distinct combinations.
+    counts = Counter(_iter_victim_keys(victims))
+    for (month_key, country, sector), count in counts.items():
+        agg = monthly_data[month_key]
+        agg.total += count
+        agg.sectors[sector] += count
+        agg.countries[country] += count
+        agg.country_sectors[country][sector] += count
         
     return monthly_data
 
-def print_monthly_summary(monthly_data):
+def process_cached_response(group_name, data_path, digest):
+    """
+    Aggregates the victims of a cached response with process_victims.
+    The result is memoized by the digest of the response, both in memory and as JSON
+    next to the cached response, so any run over an unchanged payload skips the
+    aggregation. Returns None if the response holds no victims to report.
+    """
+    monthly_data = _AGGREGATE_MEMO.get(digest)
+    if monthly_data is not None:
+        _AGGREGATE_MEMO.move_to_end(digest)
+        return monthly_data
+
+    agg_path = _cache_paths(group_name)[2]
+    try:
+        with open(agg_path, "rb") as f:
+            cached = json.load(f)
+        if cached["format"] == _AGGREGATE_FORMAT and cached["digest"] == digest:
+            monthly_data = {month: MonthAgg.from_json(data) for month, data in cached["months"].items()}
+    except Exception:
+        pass
+
+    if monthly_data is None:
+        # The payload is only parsed here; a 200 response that is not a JSON list of
+        # victims (e.g. a maintenance page) must not stay in the cache.
+        try:
+            monthly_data = dict(process_victims(_iter_cached_victims(data_path)))
+        except Exception as e:
+            print(f"An error occurred: {e}")
+            _discard_cached_response(group_name)
+            return None
+        if not monthly_data:
+            return None
+        try:
+            _write_atomic(agg_path, json.dumps({
+                "format": _AGGREGATE_FORMAT,
+                "digest": digest,
+                "months": {month: agg.to_json() for month, agg in monthly_data.items()}
+            }).encode("utf-8"))
+        except OSError:
+            pass
+
+    _AGGREGATE_MEMO[digest] = monthly_data
+    if len(_AGGREGATE_MEMO) > _AGGREGATE_MEMO_SIZE:
+        _AGGREGATE_MEMO.popitem(last=False)
+    return monthly_data
+
+def fetch_monthly_data(group_name, cache_ttl=DEFAULT_CACHE_TTL):
+    """
+    Queries the victims of a group and returns them grouped by month (see
+    process_cached_response), or None if the query failed or the group has no victims.
+    """
+    response = get_group_response(group_name, cache_ttl)
+    if response is None:
+        return None
+    data_path, digest = response
+    return process_cached_response(group_name, data_path, digest)
+
+def merge_monthly_data(monthly_data_list):
+    """
+    Merges the monthly data of several groups by summing their totals and counters.
+    The inputs are left untouched, since they may be shared with the aggregation memo.
+    """
+    merged = defaultdict(MonthAgg)
+    for monthly_data in monthly_data_list:
+        for month, agg in monthly_data.items():
+            target = merged[month]
+            target.total += agg.total
+            target.sectors += agg.sectors
+            target.countries += agg.countries
+            for country, sectors in agg.country_sectors.items():
+                target.country_sectors[country] += sectors
+    return merged
+
+def _top(counter, n):
+    """
+    Returns the n most common (key, count) pairs of a Counter, with ties in insertion order.
+    """
+    return heapq.nlargest(n, counter.items(), key=itemgetter(1))
+
+def _month_rankings(agg):
+    """
+    Returns the top 10 sectors and the top 10 countries (each with its top 3 sectors)
+    of a month. They are computed once per month and reused by every renderer.
+    """
+    rankings = agg.rankings
+    if rankings is None:
+        country_sectors = agg.country_sectors
+        top_countries = [
+            (country, count, _top(country_sectors[country], 3))
+            for country, count in _top(agg.countries, 10)
+        ]
+        rankings = agg.rankings = (_top(agg.sectors, 10), top_countries)
+    return rankings
+
+def print_monthly_summary(monthly_data, months=None):
     """
     Displays the grouped data by month in a colorful manner:
       - Total victims.
       - Top 10 sectors.
       - Top 10 countries and, for each country, the top 3 affected sectors.
+    months is the sorted list of months to display (defaults to all months, sorted).
     """
     if not monthly_data:
-        print(f"{Fore.YELLOW}No data to display.{Style.RESET_ALL}")
+        print(f"{_YELLOW}No data to display.{_RESET}")
         return
 
-    for month in sorted(monthly_data):
-        data = monthly_data[month]
-        total = data["total"]
-        top_sectors = data["sectors"].most_common(10)
-        top_countries = data["countries"].most_common(10)
+    # The whole summary is written at once instead of one print() per line. Colored
+    # headers are reset explicitly, as autoreset only applies at the end of each write.
+    if months is None:
+        months = sorted(monthly_data)
+    out = []
+    for month in months:
+        agg = monthly_data[month]
+        total = agg.total
+        top_sectors, top_countries = _month_rankings(agg)
         
-        print(f"\n{Fore.CYAN}Month: {month}{Style.RESET_ALL}")
-        print(f"  {Fore.GREEN}Total victims: {total}{Style.RESET_ALL}")
+        out.append(f"\n{_CYAN}Month: {month}{_RESET}")
+        out.append(f"  {_GREEN}Total victims: {total}{_RESET}")
         
-        print(f"  {Fore.MAGENTA}Top sectors:")
+        out.append(f"  {_MAGENTA}Top sectors:{_RESET}")
         for sector, count in top_sectors:
-            print(f"    - {sector}: {count}")
+            out.append(f"    - {sector}: {count}")
         
-        print(f"  {Fore.BLUE}Top countries:")
-        for country, count in top_countries:
-            print(f"    - {country}: {count}")
-            sectors_breakdown = data["country_sectors"][country].most_common(3)
+        out.append(f"  {_BLUE}Top countries:{_RESET}")
+        for country, count, sectors_breakdown in top_countries:
+            out.append(f"    - {country}: {count}")
             if sectors_breakdown:
-                print(f"       {Fore.YELLOW}Affected sectors:")
+                out.append(f"       {_YELLOW}Affected sectors:{_RESET}")
                 for sec, sec_count in sectors_breakdown:
-                    print(f"         * {sec}: {sec_count}")
-        print(Style.RESET_ALL)
+                    out.append(f"         * {sec}: {sec_count}")
+        out.append(_RESET)
+    sys.stdout.write("\n".join(out) + "\n")
 
-def build_json_output(monthly_data):
+def build_json_output(monthly_data, months=None):
     """
     Builds the JSON structure with the processed data for JSON output.
+    months is the sorted list of months to include (defaults to all months, sorted).
     """
+    if months is None:
+        months = sorted(monthly_data)
     output = {}
-    for month in sorted(monthly_data):
-        data = monthly_data[month]
-        top_sectors = data["sectors"].most_common(10)
-        top_countries = data["countries"].most_common(10)
+    for month in months:
+        agg = monthly_data[month]
+        top_sectors, top_countries = _month_rankings(agg)
         countries_list = []
-        for country, count in top_countries:
-            sectors_breakdown = data["country_sectors"][country].most_common(3)
+        for country, count, sectors_breakdown in top_countries:
             top_country_sectors = [{"sector": sec, "count": sec_count} for sec, sec_count in sectors_breakdown]
             countries_list.append({
                 "country": country,
@@ -116,60 +460,64 @@ def build_json_output(monthly_data):
                 "top_sectors": top_country_sectors
             })
         output[month] = {
-            "total_victims": data["total"],
+            "total_victims": agg.total,
             "top_sectors": [{"sector": sector, "count": count} for sector, count in top_sectors],
             "top_countries": countries_list
         }
     return output
 
-def write_csv_output(json_data, output_file=None):
+def _dumps_json(obj):
     """
-    Converts the output JSON into CSV format and writes it to a file (or prints to the terminal if output_file is not provided on the command line).
-    Each line represents a month with the following columns:
-      - Month
-      - Total Victims
-      - Top Sectors (format: "sector: count, ...")
-      - Top Countries (format: "country (count): [sector: count, ...]; ...")
+    Serializes obj to indented UTF-8 JSON bytes, with orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+def _iter_csv_rows(monthly_data, months):
+    """
+    Yields one (month, total, sectors, countries) CSV row for each of the given months.
     """
-    header = ["Month", "Total Victims", "Top Sectors", "Top Countries"]
-    rows = []
-    for month in sorted(json_data):
-        summary = json_data[month]
-        total_victims = summary["total_victims"]
-        top_sectors = summary["top_sectors"]
-        top_countries = summary["top_countries"]
+    for month in months:
+        agg = monthly_data[month]
+        top_sectors, top_countries = _month_rankings(agg)
         
-        sectors_str = ", ".join(f"{item['sector']}: {item['count']}" for item in top_sectors)
+        sectors_str = ", ".join(f"{sector}: {count}" for sector, count in top_sectors)
         
         countries_list = []
-        for country_info in top_countries:
-            country = country_info["country"]
-            count = country_info["count"]
-            sectors = country_info["top_sectors"]
-            sectors_detail = ", ".join(f"{s['sector']}: {s['count']}" for s in sectors)
+        for country, count, sectors_breakdown in top_countries:
+            sectors_detail = ", ".join(f"{sec}: {sec_count}" for sec, sec_count in sectors_breakdown)
             countries_list.append(f"{country} ({count}): [{sectors_detail}]")
         countries_str = "; ".join(countries_list)
         
-        rows.append({
-            "Month": month,
-            "Total Victims": total_victims,
-            "Top Sectors": sectors_str,
-            "Top Countries": countries_str
-        })
-    
+        yield month, agg.total, sectors_str, countries_str
+
+def write_csv_output_from_monthly(monthly_data, output_file=None, months=None):
+    """
+    Formats the monthly data as CSV and writes it to a file (or prints to the terminal if output_file is not provided on the command line).
+    months is the sorted list of months to write (defaults to all months, sorted).
+    Each line represents a month with the following columns:
+      - Month
+      - Total Victims
+      - Top Sectors (format: "sector: count, ...")
+      - Top Countries (format: "country (count): [sector: count, ...]; ...")
+    """
+    header = ("Month", "Total Victims", "Top Sectors", "Top Countries")
+    if months is None:
+        months = sorted(monthly_data)
     if output_file:
         try:
             with open(output_file, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=header)
-                writer.writeheader()
-                writer.writerows(rows)
+                writer = csv.writer(csvfile)
+                writer.writerow(header)
+                writer.writerows(_iter_csv_rows(monthly_data, months))
             print(f"CSV output successfully saved to: {output_file}")
         except Exception as e:
             print(f"An error occurred while writing the CSV file: {e}")
     else:
-        writer = csv.DictWriter(sys.stdout, fieldnames=header)
-        writer.writeheader()
-        writer.writerows(rows)
+        writer = csv.writer(sys.stdout)
+        writer.writerow(header)
+        writer.writerows(_iter_csv_rows(monthly_data, months))
 
 def main():
     parser = argparse.ArgumentParser(
@@ -177,7 +525,7 @@ def main():
     )
     parser.add_argument(
         "--group", required=True,
-        help="Name of the malicious actor (e.g.: 'lockbit', 'babuk2')"
+        help="Name of the malicious actor, or a comma-separated list of actors whose statistics are combined (e.g.: 'lockbit', 'babuk2,akira')"
     )
     parser.add_argument(
         "--format", choices=["normal", "json", "csv"], default="normal",
@@ -187,35 +535,48 @@ def main():
         "--output", default=None,
         help="File to save the output (valid for 'json' or 'csv' formats). If not provided, the output will be printed to the terminal."
     )
+    parser.add_argument(
+        "--cache-ttl", type=int, default=DEFAULT_CACHE_TTL,
+        help=f"Seconds to reuse the cached API response before querying ransomware.live again (default: {DEFAULT_CACHE_TTL}). Use 0 to always revalidate."
+    )
     args = parser.parse_args()
     
-    group_name = args.group.strip().lower()
-    print(f"Searching for victims for the group: {group_name} ...")
+    group_names = list(dict.fromkeys(g.strip().lower() for g in args.group.split(",") if g.strip()))
+    if not group_names:
+        parser.error("--group must name at least one group")
+    print(f"Searching for victims for the group: {', '.join(group_names)} ...")
     
-    victims = get_victims_by_group(group_name)
-    if not victims:
+    if len(group_names) == 1:
+        monthly_data = fetch_monthly_data(group_names[0], args.cache_ttl)
+    else:
+        # The queries are I/O-bound, so they run concurrently over the shared session.
+        with ThreadPoolExecutor(max_workers=min(8, len(group_names))) as executor:
+            futures = {executor.submit(fetch_monthly_data, g, args.cache_ttl): g for g in group_names}
+            results = {futures[future]: future.result() for future in as_completed(futures)}
+        # Merge in command-line order so ties in the rankings do not depend on timing.
+        found = [results[g] for g in group_names if results[g]]
+        monthly_data = merge_monthly_data(found) if found else None
+    if not monthly_data:
         print("No victims found or an error occurred when querying the ransomware.live API. Is it DOWN?")
         return
-
-    monthly_data = process_victims(victims)
     
+    months_sorted = sorted(monthly_data)
     if args.format == "normal":
-        print_monthly_summary(monthly_data)
+        print_monthly_summary(monthly_data, months_sorted)
     elif args.format == "json":
-        output_json = build_json_output(monthly_data)
-        json_string = json.dumps(output_json, indent=4, ensure_ascii=False)
+        output_json = build_json_output(monthly_data, months_sorted)
+        json_bytes = _dumps_json(output_json)
         if args.output:
             try:
-                with open(args.output, "w", encoding="utf-8") as f:
-                    f.write(json_string)
+                with open(args.output, "wb") as f:
+                    f.write(json_bytes)
                 print(f"JSON output successfully saved to file: {args.output}")
             except Exception as e:
                 print(f"An error occurred while writing the JSON file: {e}")
         else:
-            print(json_string)
+            print(json_bytes.decode("utf-8"))
     elif args.format == "csv":
-        output_json = build_json_output(monthly_data)
-        write_csv_output(output_json, args.output)
+        write_csv_output_from_monthly(monthly_data, args.output, months_sorted)
 
 if __name__ == "__main__":
     main()